@@ -0,0 +1,50 @@
+import random
+import sys
+import time
+import tracemalloc
+
+from graphs import Graph
+
+
+def measure(edges: str, imp: str, pairs):
+    """Measures the memory and query throughput of one implementation.
+    Args:
+    - edges: an edge list representation of the graph.
+    - imp: the implementation to measure, as for `Graph`.
+    - pairs: vertex pairs to query with has_edge.
+    Returns:
+    (bytes retained by the graph, seconds to iterate every neighbor of every
+    vertex, seconds to answer has_edge for pairs).
+    """
+    tracemalloc.start()
+    g = Graph(edges, imp)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for v in g.vertices():
+        for _ in g.neighbors(v):
+            pass
+    scan = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for v0, v1 in pairs:
+        g.has_edge(v0, v1)
+    lookup = time.perf_counter() - start
+    return retained, scan, lookup
+
+
+def main(path: str = 'datasets/hep.txt', imps=('list', 'compressed')):
+    edges = open(path).read()
+    vertices = list(Graph(edges, 'list').vertices())
+    rnd = random.Random(0)
+    pairs = [tuple(rnd.sample(vertices, 2)) for _ in range(20000)]
+    print(f'{path}: {len(vertices)} vertices, {len(pairs)} has_edge pairs')
+    print(f'{"imp":<12}{"memory (KiB)":>14}{"scan (s)":>10}{"has_edge (s)":>14}')
+    for imp in imps:
+        retained, scan, lookup = measure(edges, imp, pairs)
+        print(f'{imp:<12}{retained / 1024:>14.0f}{scan:>10.3f}{lookup:>14.3f}')
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:2])
@@ -1,3 +1,10 @@
+from array import array
+from bisect import bisect_right
+from collections import deque
+
+import numpy as np
+
+
 class Edge:
     """ An undirected edge. """
 
@@ -67,10 +74,353 @@ class Edge:
         return self.v0 if v == self.v1 else self.v1 if v == self.v0 else None
 
 
+class VertexIndex:
+    """ Maps external vertex ids to dense indices 0..n-1 and back. """
+
+    def __init__(self):
+        """Creates an empty index.
+        Args:
+        - self: the instance to create.
+        Returns:
+        nothing.
+        """
+        self.ids = []  # dense index -> external id
+        self.positions = dict()  # external id -> dense index
+
+    def __len__(self) -> int:
+        """Returns the number of interned vertices.
+        Args:
+        - self: this instance.
+        Returns:
+        the number of interned vertices.
+        """
+        return len(self.ids)
+
+    def __contains__(self, v) -> bool:
+        """Has the external id v been interned?
+        Allows `in` syntax.
+        Args:
+        - self: this instance.
+        - v: the external id to check.
+        Returns:
+        True if v has a dense index, False otherwise.
+        """
+        return v in self.positions
+
+    def __iter__(self):
+        """Iterates over the external ids in dense index order.
+        Args:
+        - self: this instance.
+        Returns:
+        nothing.
+        Yields:
+        external ids, the i-th of which has dense index i.
+        """
+        return iter(self.ids)
+
+    def intern(self, v) -> int:
+        """Returns the dense index of v, assigning the next free one if v is new.
+        Args:
+        - self: this instance.
+        - v: the external id to intern.
+        Returns:
+        the dense index of v.
+        """
+        i = self.positions.get(v)
+        if i is None:
+            i = self.positions[v] = len(self.ids)
+            self.ids.append(v)
+        return i
+
+    def index(self, v) -> int:
+        """Returns the dense index of the external id v.
+        Errors if v has not been interned. Check before calling.
+        Args:
+        - self: this instance.
+        - v: the external id whose dense index is sought.
+        Returns:
+        the dense index of v.
+        """
+        return self.positions[v]
+
+    def id(self, i: int):
+        """Returns the external id at dense index i.
+        Args:
+        - self: this instance.
+        - i: the dense index whose external id is sought.
+        Returns:
+        the external id with dense index i.
+        """
+        return self.ids[i]
+
+
+class EdgeList:
+    """ A parsed edge list with endpoints interned as dense indices. """
+
+    def __init__(self, edges: str):
+        """Parses edges, in the format accepted by `Graph`, once.
+        Endpoints are interned in order of first appearance, so vertex i of
+        every backend built from this instance is the i-th distinct vertex
+        in the input.
+        Args:
+        - self: the instance to create.
+        - edges: an edge list representation of the graph.
+        Returns:
+        nothing.
+        """
+        self.index = VertexIndex()
+        self.src = array('l')  # dense index of the first endpoint of each edge
+        self.dst = array('l')  # dense index of the second endpoint of each edge
+        self.wts = array('d')  # weight of each edge, 1 if the edge has none
+        self.weighted = False
+        for line in edges.splitlines():
+            line = line.split()
+            if not line:
+                continue
+            self.src.append(self.index.intern(int(line[0])))
+            self.dst.append(self.index.intern(int(line[1])))
+            if len(line) > 2:
+                self.wts.append(float(line[2]))
+                self.weighted = True
+            else:
+                self.wts.append(1)
+
+    def __len__(self) -> int:
+        """Returns the number of edges, i.e. non-empty lines, parsed.
+        Args:
+        - self: this instance.
+        Returns:
+        the number of edges parsed.
+        """
+        return len(self.src)
+
+    def __iter__(self):
+        """Iterates over the parsed edges.
+        Args:
+        - self: this instance.
+        Returns:
+        nothing.
+        Yields:
+        (u, v, w) with u, v dense indices and w the weight of the edge.
+        """
+        return zip(self.src, self.dst, self.wts)
+
+
+class CSR:
+    """ Compressed sparse row view of a graph over its dense indices. """
+
+    def __init__(self, n: int, edges):
+        """Builds the symmetric adjacency of n vertices from undirected edges.
+        Args:
+        - self: the instance to create.
+        - n: the number of vertices.
+        - edges: an EdgeList, or iterable of (u, v, w), each undirected edge
+        once, with u, v dense indices and w the weight of the edge.
+        Returns:
+        nothing.
+        """
+        if isinstance(edges, EdgeList):  # read the parsed arrays without copying
+            u = np.frombuffer(edges.src, dtype=edges.src.typecode).astype(np.int64)
+            v = np.frombuffer(edges.dst, dtype=edges.dst.typecode).astype(np.int64)
+            w = np.frombuffer(edges.wts, dtype=edges.wts.typecode)
+        else:
+            edges = list(edges)
+            u = np.array([e[0] for e in edges], dtype=np.int64)
+            v = np.array([e[1] for e in edges], dtype=np.int64)
+            w = np.array([e[2] for e in edges], dtype=float)
+        loop = u == v  # self loops are stored once, in row u
+        rows = np.concatenate((u, v[~loop]))
+        cols = np.concatenate((v, u[~loop]))
+        vals = np.concatenate((w, w[~loop]))
+        order = np.lexsort((cols, rows))  # by row, then by column within a row
+        self.n = n
+        self.rows = rows[order]  # row of each stored entry
+        self.indices = cols[order]  # column of each stored entry
+        self.data = vals[order]  # weight of each stored entry
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.rows, minlength=n), out=self.indptr[1:])
+        self.keys = self.rows * n + self.indices  # sorted, flattened (row, column) of each entry
+
+    def degrees(self) -> np.ndarray:
+        """Returns the number of stored neighbors of every vertex.
+        Args:
+        - self: this instance.
+        Returns:
+        array whose i-th entry is the degree of vertex i.
+        """
+        return np.diff(self.indptr)
+
+    def strengths(self) -> np.ndarray:
+        """Returns the total weight of the edges at every vertex.
+        Args:
+        - self: this instance.
+        Returns:
+        array whose i-th entry is the sum of the weights of the edges at i.
+        """
+        return np.bincount(self.rows, weights=self.data, minlength=self.n)
+
+    def neighbors(self, i: int) -> np.ndarray:
+        """Returns the dense indices of the neighbors of vertex i.
+        Args:
+        - self: this instance.
+        - i: the dense index of the vertex whose neighbors are sought.
+        Returns:
+        a view of the stored neighbors of i.
+        """
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def find(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """Returns the positions of the entries at (rows[k], cols[k]).
+        Entries are sorted by row then column, so all positions are found by
+        one vectorized binary search over the flattened entry keys.
+        Args:
+        - self: this instance.
+        - rows, cols: arrays of dense indices of the same length.
+        Returns:
+        array whose k-th entry is the position of (rows[k], cols[k]) in
+        indices and data, -1 if there is no such entry.
+        """
+        sought = rows * self.n + cols
+        if not len(self.keys):
+            return np.full(len(sought), -1)
+        found = np.minimum(np.searchsorted(self.keys, sought), len(self.keys) - 1)
+        return np.where(self.keys[found] == sought, found, -1)
+
+    def matvec(self, x: np.ndarray, weighted: bool = True) -> np.ndarray:
+        """Returns the product of the adjacency matrix and x.
+        Args:
+        - self: this instance.
+        - x: array with one entry per vertex.
+        - weighted: use edge weights, otherwise every edge counts as 1.
+        Returns:
+        array whose i-th entry is the (weighted) sum of x over neighbors of i.
+        """
+        products = x[self.indices]
+        if weighted:
+            products = products * self.data
+        return np.bincount(self.rows, weights=products, minlength=self.n)
+
+
+class DegreeIndex:
+    """ Degrees of the vertices of a graph, bucketed for fast queries. """
+
+    def __init__(self, g):
+        """Indexes the degrees of the vertices of g.
+        Degrees are read from the CSR view of g, so building the index costs
+        O(V + E) with every implementation. Graphs cannot be edited, so the
+        index stays valid for the lifetime of g.
+        Args:
+        - self: the instance to create.
+        - g: the graph to index.
+        Returns:
+        nothing.
+        """
+        self.index = g.vertex_index()
+        self.csr = g.csr()
+        self.degrees = self.csr.degrees()  # degree of every dense index
+        # dense indices sorted by degree; bucket d is order[starts[d]:starts[d + 1]]
+        self.order = np.argsort(self.degrees, kind='stable')
+        self.starts = np.zeros(self.max_degree() + 2, dtype=np.int64)
+        np.cumsum(self.histogram(), out=self.starts[1:])
+        self.cores = None  # computed on the first call to core_numbers()
+
+    def max_degree(self) -> int:
+        """Returns the largest degree in the graph.
+        Args:
+        - self: this instance.
+        Returns:
+        the largest degree, 0 if the graph has no vertices.
+        """
+        return int(self.degrees.max()) if len(self.degrees) else 0
+
+    def max_vertex(self):
+        """Returns a vertex of the largest degree.
+        Ties are broken in favour of the vertex seen first in the input.
+        Args:
+        - self: this instance.
+        Returns:
+        a vertex of the largest degree, None if the graph has no vertices.
+        """
+        if not len(self.degrees):
+            return None
+        return self.index.id(int(np.argmax(self.degrees)))
+
+    def with_degree(self, d: int) -> list:
+        """Returns the vertices of degree d.
+        Args:
+        - self: this instance.
+        - d: the degree sought.
+        Returns:
+        list of the vertices of degree d, in the order seen in the input.
+        """
+        if not 0 <= d <= self.max_degree():
+            return []
+        ids = self.index.ids
+        return [ids[i] for i in self.order[self.starts[d]:self.starts[d + 1]]]
+
+    def top_k(self, k: int) -> list:
+        """Returns the k vertices of largest degree.
+        Args:
+        - self: this instance.
+        - k: the number of vertices sought.
+        Returns:
+        list of (vertex, degree) for the k vertices of largest degree, by
+        decreasing degree then in the order seen in the input.
+        """
+        top = []
+        for d in range(self.max_degree(), -1, -1):
+            if len(top) >= k:
+                break
+            top.extend((v, d) for v in self.with_degree(d)[:k - len(top)])
+        return top
+
+    def histogram(self) -> np.ndarray:
+        """Returns the degree distribution of the graph.
+        Args:
+        - self: this instance.
+        Returns:
+        array whose d-th entry is the number of vertices of degree d.
+        """
+        return np.bincount(self.degrees, minlength=self.max_degree() + 1)
+
+    def core_numbers(self) -> np.ndarray:
+        """Returns the core number of every vertex.
+        The core number of v is the largest k for which v is in the k-core.
+        Computed once, in O(V + E), by the bucket algorithm of Batagelj and
+        Zaversnik.
+        Args:
+        - self: this instance.
+        Returns:
+        array whose i-th entry is the core number of dense index i.
+        """
+        if self.cores is None:
+            indptr, indices = self.csr.indptr.tolist(), self.csr.indices.tolist()
+            degree = self.degrees.tolist()
+            order = self.order.tolist()  # vertices sorted by current degree
+            starts = self.starts.tolist()  # first position of every degree in order
+            position = [0] * len(order)
+            for p, v in enumerate(order):
+                position[v] = p
+            for v in order:
+                for u in indices[indptr[v]:indptr[v + 1]]:
+                    if degree[u] > degree[v]:
+                        # swap u with the first vertex of its bucket, then shrink the bucket
+                        du, pu = degree[u], position[u]
+                        pw = starts[du]
+                        w = order[pw]
+                        if u != w:
+                            order[pu], order[pw] = w, u
+                            position[u], position[w] = pw, pu
+                        starts[du] += 1
+                        degree[u] -= 1
+            self.cores = np.array(degree, dtype=np.int64)
+        return self.cores
+
+
 class Graph:
     """ Represents an undirected, possibly weighted, graph. """
 
-    def __init__(self, edges: str, imp: str):
+    def __init__(self, edges, imp: str, lazy: bool = False):
         """Creates graph with the given edges using the specified implementation.
         edges consists of multiple lines representing an edge list
         representation of the graph. Each line contains 2 vertices and an
@@ -80,19 +430,78 @@ class Graph:
         sets   : two sets, one each for the vertices and the edges
         matrix : adjacenccy matrix
         list   : adjacency list
+        compressed : read-only adjacency lists, sorted and gap encoded as varints
+        With lazy, only the parsed edge list is kept up front and every other
+        structure, including the implementation, is built when a method
+        first needs it; see materialized() and drop().
         Args:
         self: the instance to create.
-        edges: an edge list representation of the graph
+        edges: an edge list representation of the graph, or an EdgeList
+        already parsed from one
         imp: the implementation to be used
+        lazy: defer building the implementation until it is needed
+        Returns:
+        nothing.
+        """
+        parsed = EdgeList(edges) if isinstance(edges, str) else edges
+        if lazy:
+            self._init_structures(LazyGraph(parsed, imp), imp, lazy)
+        else:
+            self._init_structures(build_backend(parsed, imp), imp, lazy)
+
+    def _init_structures(self, graph, imp: str, lazy: bool = False) -> None:
+        """Sets up the state shared by graphs and views of them.
+        Args:
+        - self: the instance to set up.
+        - graph: the implementation answering queries, None for views, which
+        answer them themselves.
+        - imp: the name of the implementation, as reported by materialized().
+        - lazy: whether graph is a LazyGraph.
         Returns:
         nothing.
         """
-        if imp == "sets":
-            self.graph = SetGraph(edges)
-        elif imp == "matrix":
-            self.graph = AdjacencyMatrix(edges)
-        elif imp == "list":
-            self.graph = AdjacencyList(edges)
+        self.graph = graph
+        self.imp = imp
+        self.lazy = lazy
+        self._csr = None  # built on the first call to csr()
+        self._degree_index = None  # built on the first call to degree_index()
+
+    def materialized(self) -> list:
+        """Returns the names of the structures of the graph built so far.
+        The names are those accepted by drop(): the implementation, as
+        passed to the constructor, 'degrees' for the degree array of lazy
+        graphs, 'csr' and 'degree_index'.
+        Args:
+        - self: the instance to operate on.
+        Returns:
+        list of the names of the structures currently in memory.
+        """
+        names = self.graph.materialized() if self.lazy else [self.imp]
+        if self._csr is not None:
+            names.append('csr')
+        if self._degree_index is not None:
+            names.append('degree_index')
+        return names
+
+    def drop(self, *names) -> None:
+        """Frees derived structures; they are rebuilt when next needed.
+        The implementation of a graph that is not lazy cannot be rebuilt and
+        is never dropped. Dropping 'csr' also drops 'degree_index', which
+        refers to it.
+        Args:
+        - self: the instance to operate on.
+        - names: the structures to drop, as named by materialized(); all of
+        them if none are given.
+        Returns:
+        nothing.
+        """
+        names = names or self.materialized()
+        if 'csr' in names or 'degree_index' in names:
+            self._degree_index = None
+        if 'csr' in names:
+            self._csr = None
+        if self.lazy:
+            self.graph.drop(names)
 
     def vertices(self):
         """Iterates over the vertices in the graph.
@@ -200,45 +609,203 @@ class Graph:
         """
         return self.graph.weight(v0, v1)
 
+    def vertex_index(self) -> VertexIndex:
+        """Returns the mapping between external vertex ids and dense indices.
+        Dense indices run from 0 to vertex_count() - 1 and are shared by all
+        implementations, so metrics can work on arrays indexed by them and
+        translate back to external ids with `id()` only when returning.
+        Args:
+        - self: the instance to operate on.
+        Returns:
+        the VertexIndex of the graph.
+        """
+        return self.graph.index
+
+    def dense_neighbors(self, i: int):
+        """Iterates over the neighbors of the vertex with dense index i.
+        Args:
+        - self: the instance to operate on.
+        - i: the dense index of the vertex whose neighbors are sought.
+        Returns:
+        nothing.
+        Yields:
+        (j, w) with j the dense index of a neighbor and w the weight of the
+        edge to it, 1 if the graph is unweighted.
+        """
+        return self.graph.dense_neighbors(i)
+
+    def dense_edges(self):
+        """Iterates over the edges of the graph as dense indices.
+        Args:
+        - self: the instance to operate on.
+        Returns:
+        nothing.
+        Yields:
+        (u, v, w), each edge once, with u, v the dense indices of its
+        endpoints and w its weight, 1 if the graph is unweighted.
+        """
+        return self.graph.dense_edges()
+
+    def csr(self) -> CSR:
+        """Returns a compressed sparse row view of the graph.
+        The view is built once, on the first call, and shared by all later
+        callers. Rows and columns are dense indices; see vertex_index().
+        Args:
+        - self: the instance to operate on.
+        Returns:
+        the CSR view of the graph.
+        """
+        if self._csr is None:
+            self._csr = CSR(self.vertex_count(), self.dense_edges())
+        return self._csr
+
+    def dense_pairs(self, pairs, validate: bool = True):
+        """Returns the dense indices of the endpoints of vertex pairs.
+        Args:
+        - self: the instance to operate on.
+        - pairs: sequence of (v0, v1) vertex pairs.
+        - validate: assert that every vertex is in the graph.
+        Returns:
+        arrays of the dense indices of all v0 and all v1, -1 for vertices not
+        in the graph.
+        """
+        positions = self.vertex_index().positions
+        dense = np.array([(positions.get(v0, -1), positions.get(v1, -1))
+                          for v0, v1 in pairs], dtype=np.int64).reshape(-1, 2)
+        if validate:
+            missing = np.flatnonzero((dense < 0).any(axis=1))
+            assert not len(missing), \
+                f'pair {missing[0]} has one or more vertices not in the graph'
+        return dense[:, 0], dense[:, 1]
+
+    def has_edges(self, pairs, validate: bool = True) -> np.ndarray:
+        """Returns whether the graph contains an edge between each vertex pair.
+        Answered for all pairs at once by searching the sorted CSR view,
+        rather than scanning adjacency once per pair.
+        Args:
+        - self: the instance to operate on.
+        - pairs: sequence of (v0, v1) vertex pairs.
+        - validate: assert that every vertex is in the graph; otherwise pairs
+        with a vertex not in the graph have no edge.
+        Returns:
+        boolean array whose k-th entry is has_edge(*pairs[k]).
+        """
+        u, v = self.dense_pairs(pairs, validate)
+        known = (u >= 0) & (v >= 0)
+        found = np.zeros(len(u), dtype=bool)
+        found[known] = self.csr().find(u[known], v[known]) >= 0
+        return found
+
+    def weights(self, pairs, validate: bool = True) -> np.ndarray:
+        """Returns the weight of the edge between each vertex pair.
+        Args:
+        - self: the instance to operate on.
+        - pairs: sequence of (v0, v1) vertex pairs.
+        - validate: assert that every vertex is in the graph; otherwise pairs
+        with a vertex not in the graph have no edge.
+        Returns:
+        float array whose k-th entry is the weight of the edge between
+        pairs[k]; nan if there is no such edge or the graph is unweighted.
+        """
+        u, v = self.dense_pairs(pairs, validate)
+        result = np.full(len(u), np.nan)
+        if self.has_weights():
+            known = np.flatnonzero((u >= 0) & (v >= 0))
+            csr = self.csr()
+            at = csr.find(u[known], v[known])
+            result[known[at >= 0]] = csr.data[at[at >= 0]]
+        return result
+
+    def degree_index(self) -> DegreeIndex:
+        """Returns the degree index of the graph.
+        The index is built once, on the first call, and answers the max
+        degree vertex, top-k by degree, the degree histogram and core
+        numbers without scanning the graph again.
+        Args:
+        - self: the instance to operate on.
+        Returns:
+        the DegreeIndex of the graph.
+        """
+        if self._degree_index is None:
+            self._degree_index = DegreeIndex(self)
+        return self._degree_index
+
+    def subgraph(self, vertices):
+        """Returns a view of the subgraph induced by vertices.
+        The view shares the adjacency of this graph; see GraphView.
+        Args:
+        - self: the instance to operate on.
+        - vertices: the vertices of the subgraph, all in this graph.
+        Returns:
+        a GraphView of the induced subgraph.
+        """
+        return GraphView(self, vertices)
+
+    def ego_network(self, v, radius: int = 1):
+        """Returns a view of the ego network of v.
+        Only the vertices within radius hops of v are visited.
+        Args:
+        - self: the instance to operate on.
+        - v: the vertex at the center of the ego network.
+        - radius: the maximum number of hops from v.
+        Returns:
+        a GraphView of the subgraph induced by vertices within radius of v.
+        """
+        index = self.vertex_index()
+        hops = {index.index(v): 0}
+        frontier = deque(hops)
+        while frontier:
+            i = frontier.popleft()
+            if hops[i] == radius:
+                continue
+            for j, _ in self.dense_neighbors(i):
+                if j not in hops:
+                    hops[j] = hops[i] + 1
+                    frontier.append(j)
+        return GraphView(self, (index.id(i) for i in hops))
+
+    def k_core(self, k: int):
+        """Returns a view of the k-core of the graph.
+        The k-core is the largest subgraph whose vertices all have degree at
+        least k within it.
+        Args:
+        - self: the instance to operate on.
+        - k: the minimum degree.
+        Returns:
+        a GraphView of the k-core, empty if there is none.
+        """
+        cores = self.degree_index().core_numbers()
+        return GraphView(self, (v for v, c in zip(self.vertex_index(), cores)
+                                if c >= k))
+
 
 """ Set Graph """
 
 
 class SetGraph(Graph):
     def __init__(self, edges):
-        self.verset = set([]) #set of vertices
-        self.edgeset = set([]) #set of edges (Edge type)
-        self.weighted = False #if the graph is weighted
-        self.edgeCount = 0 
-        self.verCount = 0
-        
-        for line in edges.splitlines(): #'line' is string form of an edge
-            if line != '':
-                line = line.split()
-                if len(line) > 2: # if the edge is weighted
-                    line = [ int(line[0]), int(line[1]), eval(line[2]) ]
-                    self.edgeset.add((Edge(line[0], line[1]), line[2])) # a tuple with edge and it's weight
-                else: # if the graph is not weighted
-                    line = [ int(line[0]), int(line[1]) ] 
-                    self.edgeset.add((Edge(line[0], line[1]), 1)) # 1 is the default weight
-                _line = line[:2] # eliminates the possibility of checking weight as a vertex
-                for ver in _line: # an edge consists of two vertices, hence the loop
-                    if ver not in self.verset:
-                        self.verCount += 1 # to keep count of the number of vertices
-                        self.verset.add(ver) # add vertex to the set
-                self.edgeCount += 1 #number of times main loop runs the number of edges
-        if len(line) > 2: # if the graph is weighted
-            self.weighted = True
+        if isinstance(edges, str):
+            edges = EdgeList(edges)
+        self.index = edges.index # maps external vertex ids to dense indices
+        self.verset = set(range(len(self.index))) #set of vertices (dense indices)
+        self.edgeset = set([]) #set of edges (Edge type) between dense indices
+        self.weighted = edges.weighted #if the graph is weighted
+        self.edgeCount = len(edges) #every line of the input is an edge
+        self.verCount = len(self.index)
+
+        for u, v, w in edges:
+            self.edgeset.add((Edge(u, v), w)) # a tuple with edge and it's weight, 1 by default
 
     def vertices(self):
         # yields vertices by iterating over the set of vetices
         for ver in self.verset:
-            yield ver
+            yield self.index.ids[ver]
 
     def edges(self):
         # yields edges by iterating over the set of edges
+        ids = self.index.ids
         for edge in self.edgeset:
-            yield edge[0]
+            yield Edge(ids[edge[0].v0], ids[edge[0].v1])
 
     def vertex_count(self) -> int:
         # returns the number of vertices
@@ -249,11 +816,12 @@ class SetGraph(Graph):
         return self.edgeCount
 
     def has_vertex(self, v) -> bool:
-        # if v exits in set of vertices then returns true, otherwise false
-        return v in self.verset
+        # if v has been given a dense index then it is in the set of vertices
+        return v in self.index
 
     def has_edge(self, v0, v1) -> bool:
         # if v0 exists in any edge and the other end of edge is v1 then returns true otherwise false
+        v0, v1 = self.index.index(v0), self.index.index(v1)
         for edge in self.edgeset:
             if v0 in edge[0] and edge[0].nbr(v0) == v1:
                 return True
@@ -263,14 +831,26 @@ class SetGraph(Graph):
         # returns True if the graph is weighted, otherwise false
         return self.weighted
 
-    def neighbors(self, v):
-        # iterates over edge and checks if v is an endpoint of an edge. if it is then yields the other endpoint
+    def dense_neighbors(self, i):
+        # iterates over edge and checks if i is an endpoint of an edge. if it is then yields the other endpoint and weight
         for edge in self.edgeset:
-            if v in edge[0]:
-                yield edge[0].nbr(v)
+            if i in edge[0]:
+                yield edge[0].nbr(i), edge[1]
+
+    def dense_edges(self):
+        # yields every edge in the set of edges with its weight
+        for edge, w in self.edgeset:
+            yield edge.v0, edge.v1, w
+
+    def neighbors(self, v):
+        # translates the dense neighbors of v back to external ids
+        ids = self.index.ids
+        for j, _ in self.dense_neighbors(self.index.index(v)):
+            yield ids[j]
 
     def degree(self, v) -> {int}:
         # if v is an endpoint of any edge. It's degree increments by 1
+        v = self.index.index(v)
         deg = 0
         for edge in self.edgeset:
             if v in edge[0]:
@@ -281,6 +861,7 @@ class SetGraph(Graph):
         # if v0 is an endpoint of an edge and v1 is the other endpoint then returns the weight, otherwise returns None
         # if the graph is unweighted the default answer is also None
         if self.weighted:
+            v0, v1 = self.index.index(v0), self.index.index(v1)
             for edge in self.edgeset:
                 if v0 in edge[0] and edge[0].nbr(v0) == v1:
                     return edge[1]
@@ -289,62 +870,31 @@ class SetGraph(Graph):
 
 class AdjacencyMatrix:
     def __init__(self, edges):
-        self.verdict = dict() #dictionary to map the vertices to sequential whole numbers
-        self.weighted = False # whether the graph is weighted or not
-        self.matrix = []
-        self.verCount = 0
-        self.edgeCount = 0
-        lst = [] #temporary lst of 0's for matrix
-        edges = edges.splitlines()
-        for line in edges: # loop#1 to collect all the vertices
-            if line != '':
-                line = line.split()
-                line = [int(line[0]), int(line[1])]
-                for ver in line:
-                    if ver not in self.verdict: 
-                        self.verdict[ver] = self.verCount # maps vertex to a whole number
-                        self.verCount += 1
-                        lst.append(0) # appends 0's to the list number of vertices times
-                self.edgeCount += 1  # number of times the for loop runs the number of edges
-                
-        for i in range(self.verCount): # appends list of 0's to the matrix number of vertices times
-            self.matrix.append(list(lst)) 
-
-        for line in edges: #loop #2 to go through the edges
-            if line != '':
-                line = line.split()
-                if len(line) > 2: # if weighted, change the corresponding row and column value to the weight
-                    line = [int(line[0]), int(line[1]), eval(line[2])]
-                    self.matrix[self.verdict[line[0]]
-                                ][self.verdict[line[1]]] = line[2]
-                    self.matrix[self.verdict[line[1]]
-                                ][self.verdict[line[0]]] = line[2]
-                else: # if unweighted, change the corresponding row and column value to the 1
-                    line = [int(line[0]), int(line[1])]
-                    self.matrix[self.verdict[line[0]]
-                                ][self.verdict[line[1]]] = 1
-                    self.matrix[self.verdict[line[1]]
-                                ][self.verdict[line[0]]] = 1
-        if len(line) > 2:
-            self.weighted = True
+        if isinstance(edges, str):
+            edges = EdgeList(edges)
+        self.index = edges.index # maps the vertices to sequential whole numbers
+        self.weighted = edges.weighted # whether the graph is weighted or not
+        self.verCount = len(self.index)
+        self.edgeCount = len(edges) # every line of the input is an edge
+        self.matrix = [[0] * self.verCount for _ in range(self.verCount)]
+
+        for u, v, w in edges: # change the corresponding row and column value to the weight, 1 if unweighted
+            self.matrix[u][v] = w
+            self.matrix[v][u] = w
 
     def vertices(self):
         # iterates over the vertices and yields them one by one
-        for key in self.verdict.keys():
-            yield key
+        for ver in self.index.ids:
+            yield ver
 
     def edges(self):
-        # iterates over the entire matrix and finds non-zero values, then appends the corresponding edges
-        keyList = list(self.verdict.keys()) #list of all vertices
-        valueList = list(self.verdict.values()) #list of whole number mapping of the vertices
-        visited = []
+        # iterates over the upper triangle of the matrix and yields the edges at non-zero values
+        ids = self.index.ids
         for i in range(self.verCount):
-            ver1 = keyList[valueList.index(i)] # gets vertex by getting the index of value list which is the same index location as the key in keylist
-            for j in range(self.verCount):
-                ver2 = keyList[valueList.index(j)] 
-                if self.matrix[i][j] and ver2 not in visited:
-                    yield Edge(ver1, ver2)
-            visited.append(ver1) # keeps check of vetices whose edges have been completely traversed
+            row = self.matrix[i]
+            for j in range(i, self.verCount):
+                if row[j]:
+                    yield Edge(ids[i], ids[j])
 
     def vertex_count(self) -> int:
         # returns number of vertices
@@ -356,30 +906,42 @@ class AdjacencyMatrix:
 
     def has_vertex(self, v) -> bool:
         # if the vertex exists in the graph returns true otherwise false
-        return v in self.verdict
+        return v in self.index
 
     def has_edge(self, v0, v1) -> bool:
         # the corresponding row and column has a weight or 1, then return true otherwise false
-        return bool(self.matrix[self.verdict[v0]][self.verdict[v1]]) == True
+        return bool(self.matrix[self.index.index(v0)][self.index.index(v1)])
 
     def has_weights(self) -> bool:
         # returns true if the graph is weighted
         return self.weighted
 
+    def dense_neighbors(self, i):
+        # yields the column and value of every non-zero entry in row i
+        for j, w in enumerate(self.matrix[i]):
+            if w:
+                yield j, w
+
+    def dense_edges(self):
+        # yields the upper triangle of the matrix at non-zero values
+        for i in range(self.verCount):
+            row = self.matrix[i]
+            for j in range(i, self.verCount):
+                if row[j]:
+                    yield i, j, row[j]
+
     def neighbors(self, v):
         # yields the neighbors of vertex v one by one
         if self.has_vertex(v):
-            keyList = list(self.verdict.keys())
-            valueList = list(self.verdict.values())
-            for i in range(self.verCount):
-                if self.matrix[self.verdict[v]][i]:
-                    yield keyList[valueList.index(i)]
+            ids = self.index.ids
+            for j, _ in self.dense_neighbors(self.index.index(v)):
+                yield ids[j]
 
     def degree(self, v) -> {int}:
         # traverses the corresponding row and increments one if a true value is encountered
         if self.has_vertex(v):
             deg = 0
-            for i in self.matrix[self.verdict[v]]:
+            for i in self.matrix[self.index.index(v)]:
                 if i:
                     deg += 1
             return deg
@@ -387,37 +949,25 @@ class AdjacencyMatrix:
     def weight(self, v0: int, v1: int):
         # returns the weight of the edge
         if self.has_edge(v0, v1) and self.weighted:
-            return self.matrix[self.verdict[v0]][self.verdict[v1]]
+            return self.matrix[self.index.index(v0)][self.index.index(v1)]
         return None
 
 
 class AdjacencyList(Graph):
 
     def __init__(self, edges):
-
-        self.adjList = dict()  # adjacency List representation
-        self.weighted = False  # weather the graph has weights or not
-        self.edgeCount = 0
-        for line in edges.splitlines():
-            if line != '':
-                line = line.split()
-                if len(line) > 2: # if weighted,then add the other end of the edge and weight as a tuple to adjacency list
-                    line = [int(line[0]), int(line[1]), eval(line[2])]
-                    self.adjList[line[0]] = self.adjList.get(
-                        line[0], []) + [(line[1], line[2])]
-                    self.adjList[line[1]] = self.adjList.get(
-                        line[1], []) + [(line[0], line[2])]
-                else: # if unweighted, then add 1 with the vertex as a default weight
-                    line = [int(line[0]), int(line[1])]
-                    self.adjList[line[0]] = self.adjList.get(
-                        line[0], []) + [(line[1], 1)]
-                    self.adjList[line[1]] = self.adjList.get(
-                        line[1], []) + [(line[0], 1)]
-                self.edgeCount += 1 # number of times main loop runs is the number of edges
-        if len(line) > 2:
-            self.weighted = True
-        # number of keys represent the number of vertex
-        self.verCount = len(self.adjList)
+        if isinstance(edges, str):
+            edges = EdgeList(edges)
+        self.index = edges.index  # maps external vertex ids to dense indices
+        self.weighted = edges.weighted  # weather the graph has weights or not
+        self.edgeCount = len(edges)  # every line of the input is an edge
+        # number of interned ids is the number of vertices
+        self.verCount = len(self.index)
+        # adjacency List representation, row i holds (neighbor, weight) of vertex i
+        self.adjList = [[] for _ in range(self.verCount)]
+        for u, v, w in edges:
+            self.adjList[u].append((v, w))
+            self.adjList[v].append((u, w))
 
     def vertex_count(self):
         # returns number of vertices
@@ -429,25 +979,25 @@ class AdjacencyList(Graph):
 
     def vertices(self):
         # yields vertices one by one
-        for key in self.adjList.keys():
-            yield key
+        for ver in self.index.ids:
+            yield ver
 
     def edges(self):
-        # yield edges one by one
-        visited = []
-        for key in self.adjList:
-            for val in self.adjList[key]:
-                if val[0] not in visited:
-                    yield Edge(key, val[0])
-            visited.append(key)
+        # yield edges one by one, each from its endpoint with the lower dense index
+        ids = self.index.ids
+        for i, row in enumerate(self.adjList):
+            for j, _ in row:
+                if j >= i:
+                    yield Edge(ids[i], ids[j])
 
     def has_vertex(self, v):
         # returns true if the vertex exists in the graph
-        return v in self.adjList
+        return v in self.index
 
     def has_edge(self, v0, v1):
         # returns true if the edge exists in the graph
-        for val in self.adjList[v0]:
+        v1 = self.index.index(v1)
+        for val in self.adjList[self.index.index(v0)]:
             if val[0] == v1:
                 return True
         return False
@@ -455,13 +1005,25 @@ class AdjacencyList(Graph):
     def degree(self, v):
         # returns the degree of the vertex
         if self.has_vertex(v):
-            return len(self.adjList[v])
+            return len(self.adjList[self.index.index(v)])
+
+    def dense_neighbors(self, i):
+        # returns (neighbor, weight) pairs of vertex i
+        return iter(self.adjList[i])
+
+    def dense_edges(self):
+        # yields every edge once, from its endpoint with the lower dense index
+        for i, row in enumerate(self.adjList):
+            for j, w in row:
+                if j >= i:
+                    yield i, j, w
 
     def neighbors(self, v):
         # returns neighbors of v
         if self.has_vertex(v):
-            for ver in self.adjList[v]:
-                yield ver[0]
+            ids = self.index.ids
+            for ver in self.adjList[self.index.index(v)]:
+                yield ids[ver[0]]
 
     def has_weights(self):
         # returns whether the graph has is weighted or not
@@ -470,7 +1032,400 @@ class AdjacencyList(Graph):
     def weight(self, v0, v1):
         # returns the weight of the corresponding edge between the given vertices
         if self.has_edge(v0, v1) and self.weighted:
-            for val in self.adjList[v0]:
+            v1 = self.index.index(v1)
+            for val in self.adjList[self.index.index(v0)]:
                 if val[0] == v1:
                     return val[1]
         return None
+
+
+""" Compressed Adjacency """
+
+
+def encode_varint(out: bytearray, x: int) -> None:
+    # appends x to out 7 bits at a time, low bits first, high bit set on all but the last byte
+    while x >= 0x80:
+        out.append((x & 0x7f) | 0x80)
+        x >>= 7
+    out.append(x)
+
+
+class CompressedAdjacency:
+    BLOCK = 16  # neighbors per block of the has_edge index
+
+    def __init__(self, edges):
+        if isinstance(edges, str):
+            edges = EdgeList(edges)
+        self.index = edges.index  # maps external vertex ids to dense indices
+        self.weighted = edges.weighted  # whether the graph is weighted or not
+        self.edgeCount = len(edges)  # every line of the input is an edge
+        self.verCount = len(self.index)
+        csr = CSR(self.verCount, edges)
+        neighbors = csr.indices.tolist()  # the CSR keeps every row sorted
+        # weight of every entry, in the order of the encoded neighbors
+        self.wts = array('d', csr.data.tolist() if self.weighted else [])
+        self.entries = array('q', csr.indptr.tolist())  # first entry of every row
+        self.blob = bytearray()  # gap encoded neighbors of all rows, back to back
+        self.heads = array('l')  # first neighbor of every block
+        self.head_offsets = array('q')  # position in blob of every block
+        self.head_start = array('q', [0])  # first block of every row
+        for i in range(self.verCount):
+            lo, hi = self.entries[i], self.entries[i + 1]
+            for k in range(lo, hi):
+                if (k - lo) % self.BLOCK == 0:  # blocks restart the gaps from 0
+                    self.heads.append(neighbors[k])
+                    self.head_offsets.append(len(self.blob))
+                    prev = 0
+                encode_varint(self.blob, neighbors[k] - prev)
+                prev = neighbors[k]
+            self.head_start.append(len(self.heads))
+        self.blob = bytes(self.blob)
+
+    def decode(self, offset: int, count: int):
+        # yields count neighbors gap encoded in blob from offset
+        blob, value = self.blob, 0
+        for _ in range(count):
+            gap, shift = 0, 0
+            byte = blob[offset]
+            while byte & 0x80:
+                gap |= (byte & 0x7f) << shift
+                shift += 7
+                offset += 1
+                byte = blob[offset]
+            gap |= byte << shift
+            offset += 1
+            value += gap
+            yield value
+
+    def row(self, i: int):
+        # yields the neighbors of vertex i one block at a time
+        lo, hi = self.entries[i], self.entries[i + 1]
+        for b in range(self.head_start[i], self.head_start[i + 1]):
+            count = min(self.BLOCK, hi - lo)
+            yield from self.decode(self.head_offsets[b], count)
+            lo += count
+
+    def find(self, i: int, j: int) -> int:
+        # entry of neighbor j in the row of vertex i, -1 if absent
+        hs, he = self.head_start[i], self.head_start[i + 1]
+        b = bisect_right(self.heads, j, hs, he) - 1  # last block starting at or before j
+        if b < hs:
+            return -1
+        k = self.entries[i] + (b - hs) * self.BLOCK
+        count = min(self.BLOCK, self.entries[i + 1] - k)
+        for value in self.decode(self.head_offsets[b], count):
+            if value >= j:
+                return k if value == j else -1
+            k += 1
+        return -1
+
+    def vertices(self):
+        # yields vertices one by one
+        for ver in self.index.ids:
+            yield ver
+
+    def edges(self):
+        # yields edges one by one, each from its endpoint with the lower dense index
+        ids = self.index.ids
+        for i, j, _ in self.dense_edges():
+            yield Edge(ids[i], ids[j])
+
+    def vertex_count(self) -> int:
+        # returns number of vertices
+        return self.verCount
+
+    def edge_count(self) -> int:
+        # returns number of edges
+        return self.edgeCount
+
+    def has_vertex(self, v) -> bool:
+        # returns true if the vertex exists in the graph
+        return v in self.index
+
+    def has_edge(self, v0, v1) -> bool:
+        # searches the block index of v0 for v1
+        return self.find(self.index.index(v0), self.index.index(v1)) >= 0
+
+    def has_weights(self) -> bool:
+        # returns whether the graph is weighted or not
+        return self.weighted
+
+    def dense_neighbors(self, i):
+        # decodes the row of i, pairing every neighbor with its weight
+        if not self.weighted:
+            for j in self.row(i):
+                yield j, 1
+        else:
+            for k, j in enumerate(self.row(i), self.entries[i]):
+                yield j, self.wts[k]
+
+    def dense_edges(self):
+        # yields every edge once, from its endpoint with the lower dense index
+        for i in range(self.verCount):
+            for j, w in self.dense_neighbors(i):
+                if j >= i:
+                    yield i, j, w
+
+    def neighbors(self, v):
+        # decodes the row of v and translates it to external ids
+        if self.has_vertex(v):
+            ids = self.index.ids
+            for j in self.row(self.index.index(v)):
+                yield ids[j]
+
+    def degree(self, v) -> int:
+        # the length of the row of v
+        if self.has_vertex(v):
+            i = self.index.index(v)
+            return self.entries[i + 1] - self.entries[i]
+
+    def weight(self, v0: int, v1: int):
+        # returns the weight stored with the entry of v1 in the row of v0
+        if self.weighted:
+            k = self.find(self.index.index(v0), self.index.index(v1))
+            if k >= 0:
+                return self.wts[k]
+        return None
+
+
+def build_backend(parsed: EdgeList, imp: str):
+    # the implementation named imp of the parsed edges, None if there is no such implementation
+    if imp == "sets":
+        return SetGraph(parsed)
+    elif imp == "matrix":
+        return AdjacencyMatrix(parsed)
+    elif imp == "list":
+        return AdjacencyList(parsed)
+    elif imp == "compressed":
+        return CompressedAdjacency(parsed)
+
+
+""" Lazy Graph """
+
+
+class LazyGraph:
+    def __init__(self, parsed, imp):
+        self.parsed = parsed  # the edge arrays every other structure is built from
+        self.index = parsed.index  # maps external vertex ids to dense indices
+        self.imp = imp  # implementation to build for adjacency queries
+        self.backend = None  # built on the first adjacency query
+        self.degrees = None  # built on the first call to degree()
+
+    def built(self):
+        # the implementation, built from the parsed edges on first use
+        if self.backend is None:
+            self.backend = build_backend(self.parsed, self.imp)
+        return self.backend
+
+    def materialized(self):
+        # names of the structures built so far
+        names = []
+        if self.backend is not None:
+            names.append(self.imp)
+        if self.degrees is not None:
+            names.append('degrees')
+        return names
+
+    def drop(self, names):
+        # frees the named structures, keeping the parsed edges to rebuild them
+        if self.imp in names:
+            self.backend = None
+        if 'degrees' in names:
+            self.degrees = None
+
+    def vertices(self):
+        # yields vertices in dense index order, no structure needed
+        return iter(self.index)
+
+    def edge_arrays(self):
+        # the parsed edges as the implementation would store them, from the parsed arrays alone
+        parsed = self.parsed
+        u = np.frombuffer(parsed.src, dtype=parsed.src.typecode)
+        v = np.frombuffer(parsed.dst, dtype=parsed.dst.typecode)
+        w = np.frombuffer(parsed.wts, dtype=parsed.wts.typecode)
+        lo, hi = np.minimum(u, v), np.maximum(u, v)
+        if self.imp == "sets":  # equal (edge, weight) pairs are one element of the set
+            _, keep = np.unique(np.stack((lo, hi, w), axis=1), axis=0,
+                                return_index=True)
+        elif self.imp == "matrix":  # a cell holds one edge, with the last weight written to it
+            _, last = np.unique((lo * len(self.index) + hi)[::-1],
+                                return_index=True)
+            keep = len(lo) - 1 - last
+        elif self.imp == "list":  # a self loop is listed twice in its row
+            keep = np.concatenate((np.arange(len(lo)), np.flatnonzero(lo == hi)))
+        else:  # compressed rows keep every parsed edge
+            keep = np.arange(len(lo))
+        keep = np.sort(keep)
+        return lo[keep], hi[keep], w[keep]
+
+    def dense_edges(self):
+        # yields the edges the implementation would hold, without building it
+        u, v, w = self.edge_arrays()
+        return zip(u.tolist(), v.tolist(), w.tolist())
+
+    def edges(self):
+        # yields the edges the implementation would hold, with external ids
+        ids = self.index.ids
+        for u, v, _ in self.dense_edges():
+            yield Edge(ids[u], ids[v])
+
+    def vertex_count(self) -> int:
+        # returns the number of interned vertices
+        return len(self.index)
+
+    def edge_count(self) -> int:
+        # returns the number of parsed edges
+        return len(self.parsed)
+
+    def has_vertex(self, v) -> bool:
+        # returns true if v was interned while parsing
+        return v in self.index
+
+    def has_weights(self) -> bool:
+        # returns true if any parsed edge has a weight
+        return self.parsed.weighted
+
+    def degree(self, v) -> int:
+        # counts the edges the implementation would hold at every vertex, on the first call
+        # a self loop counts once per time edge_arrays() lists it
+        if self.degrees is None:
+            n = len(self.index)
+            src, dst, _ = self.edge_arrays()
+            self.degrees = np.bincount(src, minlength=n) + \
+                np.bincount(dst[src != dst], minlength=n)
+        return int(self.degrees[self.index.index(v)])
+
+    def has_edge(self, v0, v1) -> bool:
+        # answered by the implementation, built on first use
+        return self.built().has_edge(v0, v1)
+
+    def dense_neighbors(self, i):
+        # answered by the implementation, built on first use
+        return self.built().dense_neighbors(i)
+
+    def neighbors(self, v):
+        # answered by the implementation, built on first use
+        return self.built().neighbors(v)
+
+    def weight(self, v0: int, v1: int):
+        # answered by the implementation, built on first use
+        return self.built().weight(v0, v1)
+
+
+""" Graph View """
+
+
+class GraphView(Graph):
+    """ Read-only subgraph of a graph induced by some of its vertices. """
+
+    def __init__(self, g: Graph, vertices):
+        """Creates a view of the subgraph of g induced by vertices.
+        Nothing of g is copied: the view keeps the vertex subset and filters
+        the neighbors of g as they are iterated, so building and querying it
+        costs time in the size of the subset and its edges, not of g.
+        Changes to g are not supported while views of it are in use.
+        Args:
+        - self: the instance to create.
+        - g: the graph, or view, to take the subgraph of.
+        - vertices: the vertices of the subgraph, all in g.
+        Returns:
+        nothing.
+        """
+        self._init_structures(None, 'view')
+        self.base = g
+        self.index = VertexIndex()  # dense indices of the view
+        self.members = dict()  # dense index in g -> dense index in the view
+        self.base_indices = array('l')  # dense index in the view -> dense index in g
+        base_index = g.vertex_index()
+        for v in vertices:
+            i = base_index.index(v)
+            if i not in self.members:
+                self.members[i] = self.index.intern(v)
+                self.base_indices.append(i)
+        self.edgeCount = None  # counted on the first call to edge_count()
+
+    def materialize(self, imp: str) -> Graph:
+        """Returns a compact copy of the view as a graph of its own.
+        The copy is built from the dense edges of the view, with the vertices
+        in the same order, including those without edges in the view.
+        Args:
+        - self: the instance to operate on.
+        - imp: the implementation to be used, as for `Graph`.
+        Returns:
+        a new Graph with the vertices and edges of the view.
+        """
+        parsed = EdgeList('')
+        for v in self.index:
+            parsed.index.intern(v)
+        for u, v, w in self.dense_edges():
+            parsed.src.append(u)
+            parsed.dst.append(v)
+            parsed.wts.append(w)
+        parsed.weighted = self.has_weights()
+        return Graph(parsed, imp)
+
+    def vertex_index(self) -> VertexIndex:
+        # the view numbers its vertices densely on its own
+        return self.index
+
+    def dense_neighbors(self, i: int):
+        # neighbors of the vertex in g that are in the view, translated to dense indices of the view
+        members = self.members
+        for j, w in self.base.dense_neighbors(self.base_indices[i]):
+            if j in members:
+                yield members[j], w
+
+    def dense_edges(self):
+        # yields every edge once, from its endpoint with the lower dense index
+        for i in range(len(self.index)):
+            for j, w in self.dense_neighbors(i):
+                if j >= i:
+                    yield i, j, w
+
+    def vertices(self):
+        # yields the vertices of the view in dense index order
+        return iter(self.index)
+
+    def edges(self):
+        # yields edges of g between vertices of the view
+        ids = self.index.ids
+        for u, v, _ in self.dense_edges():
+            yield Edge(ids[u], ids[v])
+
+    def vertex_count(self) -> int:
+        # returns the number of vertices in the view
+        return len(self.index)
+
+    def edge_count(self) -> int:
+        # counts the edges once, on the first call
+        if self.edgeCount is None:
+            self.edgeCount = sum(1 for _ in self.dense_edges())
+        return self.edgeCount
+
+    def has_vertex(self, v) -> bool:
+        # returns true if v is one of the vertices of the view
+        return v in self.index
+
+    def has_edge(self, v0, v1) -> bool:
+        # an edge of g between vertices of the view is an edge of the view
+        assert self.has_vertex(v0) and self.has_vertex(v1), \
+            f'one or more of {v0} and {v1} are not valid vertices'
+        return self.base.has_edge(v0, v1)
+
+    def has_weights(self) -> bool:
+        # the view is weighted if g is
+        return self.base.has_weights()
+
+    def neighbors(self, v):
+        # yields neighbors of v in g that are in the view
+        ids = self.index.ids
+        for j, _ in self.dense_neighbors(self.index.index(v)):
+            yield ids[j]
+
+    def degree(self, v) -> int:
+        # counts neighbors of v in g that are in the view
+        return sum(1 for _ in self.dense_neighbors(self.index.index(v)))
+
+    def weight(self, v0: int, v1: int):
+        # returns the weight of the edge in g
+        return self.base.weight(v0, v1)
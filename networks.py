@@ -1,26 +1,23 @@
 import graphviz
 from graphs import *
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heappop, heappush
 import math
+import os
+import random
+import numpy as np
 
 
 def local_centrality(g: Graph, vtx: int) -> int:
-    nbr = list()  # list saving the neighbors visited
-    L = 0  # number of edges
-    ki = 0  # number of neighbors
-    for n in g.neighbors(vtx):
-        for n_of_n in g.neighbors(vtx):
-            if n == n_of_n:
-                continue
-            else:
-                if n_of_n in nbr:  # preventing self connection
-                    continue
-                elif n_of_n in g.neighbors(n):
-                    L += 1
-
-        ki += 1
-        nbr.append(n)
+    nbr = list(g.neighbors(vtx))  # list saving the neighbors
+    ki = len(nbr)  # number of neighbors
     if ki == 1:  # preventing division by zero error
         return 0
+    # every pair of distinct neighbors once, checked for an edge all at once
+    pairs = [(n, n_of_n) for a, n in enumerate(nbr) for n_of_n in nbr[a + 1:]
+             if n != n_of_n]
+    L = int(g.has_edges(pairs, validate=False).sum()) if pairs else 0  # number of edges
     return (L / ((ki*(ki-1))/2))
 
 
@@ -47,6 +44,184 @@ def dijkstra(g: Graph, src, nodes, dst=None):
     return dist
 
 
+def power_iteration(step, x, tol, max_iter, report=None):
+    # repeats x = step(x) until the L1 change between iterates drops below tol
+    for it in range(1, max_iter + 1):
+        x_new = step(x)
+        residual = float(np.abs(x_new - x).sum())
+        if report is not None:
+            report(it, residual)
+        x = x_new
+        if residual < tol:
+            return x
+    raise RuntimeError(
+        f'power iteration did not converge in {max_iter} iterations')
+
+
+def start_vector(g: Graph, start):
+    # dense starting vector from a previous {vertex: score} result, uniform otherwise
+    n = g.vertex_count()
+    if start is None:
+        return np.full(n, 1 / n)
+    x = np.array([start.get(v, 0) for v in g.vertex_index()], dtype=float)
+    if not x.any():
+        return np.full(n, 1 / n)
+    return x / x.sum()
+
+
+def single_source_paths(adj, s):
+    # BFS, or heap dijkstra if weighted, from s over adj = (indptr, indices, data, weighted)
+    # returns reached vertices in order of distance, their distances, shortest path counts and predecessors
+    indptr, indices, data, weighted = adj
+    order, dist, sigma, preds = [], {s: 0}, {s: 1}, {s: []}
+    if not weighted:
+        frontier = deque([s])
+        while frontier:
+            u = frontier.popleft()
+            order.append(u)
+            du = dist[u] + 1
+            for v in indices[indptr[u]:indptr[u + 1]]:
+                if v not in dist:
+                    dist[v], sigma[v], preds[v] = du, 0, []
+                    frontier.append(v)
+                if dist[v] == du:
+                    sigma[v] += sigma[u]
+                    preds[v].append(u)
+        return order, dist, sigma, preds
+    seen, done = {s: 0}, set()
+    heap = [(0, s)]
+    while heap:
+        du, u = heappop(heap)
+        if u in done:
+            continue
+        done.add(u)
+        order.append(u)
+        for k in range(indptr[u], indptr[u + 1]):
+            v, alt = indices[k], du + data[k]
+            if v in done:
+                continue
+            if v not in seen or alt < seen[v]:
+                seen[v], sigma[v], preds[v] = alt, sigma[u], [u]
+                heappush(heap, (alt, v))
+            elif alt == seen[v]:
+                sigma[v] += sigma[u]
+                preds[v].append(u)
+    return order, seen, sigma, preds
+
+
+def path_totals(adj, sources, betweenness=True):
+    # per-vertex sums over sources: brandes dependencies, number of sources reaching it and their total distance
+    n = len(adj[0]) - 1
+    dependency, reached, distance = [0.0] * n, [0] * n, [0.0] * n
+    for s in sources:
+        order, dist, sigma, preds = single_source_paths(adj, s)
+        for v in order[1:]:
+            reached[v] += 1
+            distance[v] += dist[v]
+        if betweenness:
+            delta = dict.fromkeys(order, 0.0)
+            for w in reversed(order):
+                coeff = (1 + delta[w]) / sigma[w]
+                for v in preds[w]:
+                    delta[v] += sigma[v] * coeff
+                if w != s:
+                    dependency[w] += delta[w]
+    return dependency, reached, distance
+
+
+_worker_adj = None  # adjacency shared with path_totals in pool workers
+
+
+def init_path_worker(adj):
+    global _worker_adj
+    _worker_adj = adj
+
+
+def pooled_path_totals(sources, betweenness):
+    return path_totals(_worker_adj, sources, betweenness)
+
+
+def all_path_totals(g: Graph, k, seed, processes, betweenness):
+    # path_totals over all sources, or k sampled with seed, split across a process pool
+    # returns the sources used and the summed totals as arrays
+    if k is not None and k < 1:
+        raise ValueError(f'k must be at least 1 to sample pivots, got {k}')
+    csr = g.csr()
+    adj = (csr.indptr.tolist(), csr.indices.tolist(),
+           csr.data.tolist() if g.has_weights() else None, g.has_weights())
+    n = g.vertex_count()
+    sources = list(range(n)) if k is None or k >= n else \
+        random.Random(seed).sample(range(n), k)
+    processes = processes or os.cpu_count() or 1
+    if processes <= 1 or len(sources) < 2 * processes:
+        totals = [path_totals(adj, sources, betweenness)]
+    else:
+        chunks = [sources[i::4 * processes] for i in range(4 * processes)]
+        with ProcessPoolExecutor(processes, initializer=init_path_worker,
+                                 initargs=(adj,)) as pool:
+            totals = list(pool.map(pooled_path_totals, chunks,
+                                   [betweenness] * len(chunks)))
+    return sources, [np.sum([t[i] for t in totals], axis=0) for i in range(3)]
+
+
+def bfs_distance_rows(csr: CSR, sources):
+    # bit-parallel BFS from up to 64 sources at a time; bit b of a vertex's mask stands for sources[b]
+    # yields the dense index of every source and its row of hop counts, -1 where unreachable
+    n = csr.n
+    isolated = csr.degrees() == 0
+    gather = np.zeros(len(csr.indices) + 1, dtype=np.uint64)  # padded so reduceat accepts empty rows at the end
+    bits = np.uint64(1) << np.arange(64, dtype=np.uint64)
+    for start in range(0, len(sources), 64):
+        batch = sources[start:start + 64]
+        dist = np.full((len(batch), n), -1, dtype=np.int32)
+        frontier = np.zeros(n, dtype=np.uint64)
+        for b, s in enumerate(batch):
+            frontier[s] |= bits[b]
+            dist[b, s] = 0
+        visited = frontier.copy()
+        level = 0
+        while frontier.any():
+            level += 1
+            gather[:-1] = frontier[csr.indices]
+            reached = np.bitwise_or.reduceat(gather, csr.indptr[:-1])
+            reached[isolated] = 0
+            frontier = reached & ~visited
+            visited |= frontier
+            found = np.flatnonzero(frontier)
+            b, k = np.nonzero((frontier[found][None, :] & bits[:len(batch), None]) != 0)
+            dist[b, found[k]] = level
+        yield from zip(batch, dist)
+
+
+def dijkstra_distance_rows(g: Graph, sources):
+    # heap dijkstra from every source over the weighted CSR view
+    # yields the dense index of every source and its row of distances, inf where unreachable
+    csr = g.csr()
+    adj = (csr.indptr.tolist(), csr.indices.tolist(), csr.data.tolist(), True)
+    for s in sources:
+        row = np.full(csr.n, np.inf)
+        _, dist, _, _ = single_source_paths(adj, s)
+        row[list(dist)] = list(dist.values())
+        yield s, row
+
+
+def distance_rows(g: Graph, sources=None):
+    # rows of the distance matrix from the dense indices sources, all vertices if None
+    if sources is None:
+        sources = list(range(g.vertex_count()))
+    if g.has_weights():
+        return dijkstra_distance_rows(g, sources)
+    return bfs_distance_rows(g.csr(), sources)
+
+
+def reachable_distances(g: Graph):
+    # yields every vertex with the distances from it to the other vertices it reaches
+    ids = g.vertex_index().ids
+    for s, row in distance_rows(g):
+        reached = (row > 0) & (row < np.inf)
+        yield ids[s], row[reached]
+
+
 class NetworkOperations:
     def degree_centrality(g: Graph, vtx: int) -> float:
         """Returns the degree centrality of the vertex, vtx in the graph, g.
@@ -118,6 +293,149 @@ class NetworkOperations:
                 intersection += 1
         return intersection/(ni+nj-intersection)  # intersection/union
 
+    def top_degree(g: Graph, k: int) -> list:
+        """Returns the k vertices of largest degree in g.
+        Args:
+        - g: the graph/network to be checked.
+        - k: the number of vertices sought.
+        Returns:
+        list of (vertex, degree) by decreasing degree.
+        """
+        return g.degree_index().top_k(k)
+
+    def degree_histogram(g: Graph) -> list:
+        """Returns the degree distribution of g.
+        Args:
+        - g: the graph/network to be checked.
+        Returns:
+        list whose d-th entry is the number of vertices of degree d in g.
+        """
+        return g.degree_index().histogram().tolist()
+
+    def core_numbers(g: Graph) -> dict:
+        """Returns the k-core decomposition of g.
+        Args:
+        - g: the graph/network to be checked.
+        Returns:
+        dict mapping every vertex of g to the largest k such that the vertex
+        is in the k-core of g.
+        """
+        cores = g.degree_index().core_numbers()
+        return dict(zip(g.vertex_index(), cores.tolist()))
+
+    def similarities(g: Graph, pairs, validate: bool = True) -> np.ndarray:
+        """Returns the Jaccard similarity of every vertex pair in g.
+        Pairs are grouped by their first vertex so that its neighbors are
+        fetched once per group.
+        Args:
+        - g: the graph/network to be checked.
+        - pairs: sequence of (v0, v1) vertex pairs in g.
+        - validate: assert that every vertex is in g.
+        Returns:
+        float array whose k-th entry is similarity(g, *pairs[k]); 0 for pairs
+        with a vertex not in g, or where neither vertex has a neighbor.
+        """
+        u, v = g.dense_pairs(pairs, validate)
+        csr = g.csr()
+        indptr, indices = csr.indptr.tolist(), csr.indices.tolist()
+        result = np.zeros(len(u))
+        order = np.argsort(u, kind='stable')
+        group, nbr = -1, set()
+        for k in order.tolist():
+            i, j = int(u[k]), int(v[k])
+            if i < 0 or j < 0:
+                continue
+            if i != group:
+                group, nbr = i, set(indices[indptr[i]:indptr[i + 1]])
+            intersection = len(nbr.intersection(indices[indptr[j]:indptr[j + 1]]))
+            union = (indptr[i + 1] - indptr[i]) + (indptr[j + 1] - indptr[j]) \
+                - intersection
+            if union:
+                result[k] = intersection / union
+        return result
+
+    def distance_rows(g: Graph, sources=None):
+        """Iterates over the rows of the distance matrix of g, one at a time.
+        Unweighted graphs run a bit-parallel BFS from 64 sources at a time;
+        weighted graphs run heap Dijkstra from each source. Only a batch of
+        rows is held in memory, so every row of large graphs can be visited.
+        Args:
+        - g: the graph/network to be checked.
+        - sources: the vertices to measure distances from; all if None.
+        Returns:
+        nothing.
+        Yields:
+        (vertex, row) for every source, where row[j] is the distance to the
+        j-th vertex of g.vertices(): an int32 hop count, -1 if unreachable,
+        on unweighted graphs; a float, inf if unreachable, on weighted ones.
+        """
+        index = g.vertex_index()
+        if sources is not None:
+            sources = [index.index(v) for v in sources]
+        for s, row in distance_rows(g, sources):
+            yield index.id(s), row
+
+    def distance_matrix(g: Graph, sources=None, targets=None) -> np.ndarray:
+        """Returns the shortest path distances between vertices of g.
+        Args:
+        - g: the graph/network to be checked.
+        - sources: the vertices of the rows; all, in g.vertices() order, if None.
+        - targets: the vertices of the columns; all, in g.vertices() order,
+        if None.
+        Returns:
+        array of shape (len(sources), len(targets)) of the distances, in the
+        format of distance_rows().
+        """
+        rows = [row for _, row in NetworkOperations.distance_rows(g, sources)]
+        if g.has_weights():
+            matrix = np.array(rows, dtype=float).reshape(-1, g.vertex_count())
+        else:
+            matrix = np.array(rows, dtype=np.int32).reshape(-1, g.vertex_count())
+        if targets is not None:
+            index = g.vertex_index()
+            matrix = matrix[:, [index.index(v) for v in targets]]
+        return matrix
+
+    def eccentricity(g: Graph, vtx: int = None):
+        """Returns the eccentricity of vtx, or of every vertex, in g.
+        The eccentricity of a vertex is its largest distance to a vertex it
+        reaches; vertices in other components are ignored.
+        Args:
+        - g: the graph/network to be checked.
+        - vtx: the vertex whose eccentricity is sought; None for all.
+        Returns:
+        the eccentricity of vtx, or dict mapping every vertex to it.
+        """
+        if vtx is not None:
+            _, row = next(NetworkOperations.distance_rows(g, [vtx]))
+            reached = row[(row > 0) & (row < np.inf)]
+            return reached.max().item() if len(reached) else 0
+        return {v: reached.max().item() if len(reached) else 0
+                for v, reached in reachable_distances(g)}
+
+    def diameter(g: Graph):
+        """Returns the diameter of g.
+        Args:
+        - g: the graph/network to be checked.
+        Returns:
+        the largest distance between two connected vertices of g.
+        """
+        return max(NetworkOperations.eccentricity(g).values(), default=0)
+
+    def average_shortest_path_length(g: Graph) -> float:
+        """Returns the average shortest path length of g.
+        Args:
+        - g: the graph/network to be checked.
+        Returns:
+        the mean distance over all ordered pairs of distinct connected
+        vertices of g; 0 if there are none.
+        """
+        total, pairs = 0, 0
+        for _, reached in reachable_distances(g):
+            total += reached.sum().item()
+            pairs += len(reached)
+        return total / pairs if pairs else 0
+
     def popular_distance(g: Graph, vtx: int) -> int:
         """Returns the popular distance of the vertex, vtx, in g.
         Args:
@@ -126,18 +444,126 @@ class NetworkOperations:
         Returns:
         the popular distance of the vertex, vtx, in g.
         """
-        # finding popular vertex first
-        max_dist, source = 0, 0
-
-        # calculating the popular node
-        nodes = []
-        for i in g.vertices():
-            deg = g.degree(i)
-            if deg > max_dist:
-                max_dist, source = deg, i
-            nodes.append(i)
-            
-        return dijkstra(g, vtx, nodes, source)
+        # the popular vertex has the largest degree
+        source = g.degree_index().max_vertex()
+        return dijkstra(g, vtx, list(g.vertices()), source)
+
+    def pagerank(g: Graph, alpha: float = 0.85, tol: float = 1e-8,
+                 max_iter: int = 100, start: dict = None,
+                 report=None) -> dict:
+        """Returns the PageRank of every vertex in g.
+        Computed by power iteration on the CSR view of g; edge weights are
+        honoured when g has them. Vertices without edges spread their rank
+        uniformly.
+        Args:
+        - g: the graph/network to be checked.
+        - alpha: the damping factor.
+        - tol: iteration stops once the L1 change between iterates is below tol.
+        - max_iter: the number of iterations after which to give up.
+        - start: a previous result to warm start from, e.g. before an edit.
+        - report: called as report(iteration, residual) after every iteration.
+        Returns:
+        dict mapping every vertex of g to its PageRank; the values sum to 1.
+        Raises RuntimeError if the iteration does not converge in max_iter.
+        """
+        n = g.vertex_count()
+        csr = g.csr()
+        strength = csr.strengths() if g.has_weights() else \
+            csr.degrees().astype(float)
+        dangling = strength == 0
+        inv_strength = np.divide(1, strength, out=np.zeros(n),
+                                 where=~dangling)
+
+        def step(x):
+            spread = csr.matvec(x * inv_strength, g.has_weights())
+            return alpha * (spread + x[dangling].sum() / n) + (1 - alpha) / n
+
+        x = power_iteration(step, start_vector(g, start), tol, max_iter,
+                            report)
+        return dict(zip(g.vertex_index(), x.tolist()))
+
+    def eigenvector_centrality(g: Graph, tol: float = 1e-8,
+                               max_iter: int = 100, start: dict = None,
+                               report=None) -> dict:
+        """Returns the eigenvector centrality of every vertex in g.
+        Computed by power iteration with A + I, where A is the (weighted)
+        adjacency matrix, which has the same leading eigenvector as A but
+        does not oscillate on bipartite graphs.
+        Args:
+        - g: the graph/network to be checked.
+        - tol: iteration stops once the L1 change between iterates is below tol.
+        - max_iter: the number of iterations after which to give up.
+        - start: a previous result to warm start from, e.g. before an edit.
+        - report: called as report(iteration, residual) after every iteration.
+        Returns:
+        dict mapping every vertex of g to its centrality; the values have
+        unit Euclidean norm.
+        Raises RuntimeError if the iteration does not converge in max_iter.
+        """
+        csr = g.csr()
+
+        def step(x):
+            x = x + csr.matvec(x, g.has_weights())
+            return x / np.linalg.norm(x)
+
+        x = start_vector(g, start)
+        x = power_iteration(step, x / np.linalg.norm(x), tol, max_iter,
+                            report)
+        return dict(zip(g.vertex_index(), x.tolist()))
+
+    def betweenness_centrality(g: Graph, k: int = None, seed=None,
+                               normalized: bool = True,
+                               processes: int = None) -> dict:
+        """Returns the betweenness centrality of every vertex in g.
+        Uses Brandes' algorithm with BFS, or heap Dijkstra if g is weighted,
+        from every source vertex, or from k pivot sources sampled with seed
+        to trade accuracy for time; sampled results are scaled by n / k.
+        Sources are split across a pool of processes.
+        Args:
+        - g: the graph/network to be checked.
+        - k: the number of pivots to sample; None for the exact result.
+        - seed: the seed used to sample the pivots.
+        - normalized: divide by the number of vertex pairs not including
+        the vertex, (n-1)(n-2)/2.
+        - processes: the size of the process pool; None for one per CPU,
+        1 to run in this process.
+        Returns:
+        dict mapping every vertex of g to its betweenness centrality.
+        Raises ValueError if k is less than 1.
+        """
+        n = g.vertex_count()
+        sources, (dependency, _, _) = all_path_totals(g, k, seed, processes,
+                                                      True)
+        scale = 1 / ((n - 1) * (n - 2)) if normalized and n > 2 else 0.5
+        dependency = dependency * (scale * n / len(sources))
+        return dict(zip(g.vertex_index(), dependency.tolist()))
+
+    def closeness_centrality(g: Graph, k: int = None, seed=None,
+                             processes: int = None) -> dict:
+        """Returns the closeness centrality of every vertex in g.
+        The closeness of v is (r-1)/(n-1) * (r-1)/d, where r is the size of
+        its component and d its total distance to the rest, which keeps
+        values comparable across components. With k, distances are only
+        computed from k pivot sources sampled with seed, and r and d are
+        estimated from the pivots that reach v.
+        Args:
+        - g: the graph/network to be checked.
+        - k: the number of pivots to sample; None for the exact result.
+        - seed: the seed used to sample the pivots.
+        - processes: the size of the process pool; None for one per CPU,
+        1 to run in this process.
+        Returns:
+        dict mapping every vertex of g to its closeness centrality.
+        Raises ValueError if k is less than 1.
+        """
+        n = g.vertex_count()
+        sources, (_, reached, distance) = all_path_totals(g, k, seed,
+                                                          processes, False)
+        pivots = np.full(n, len(sources), dtype=float)
+        pivots[sources] -= 1  # a pivot does not reach itself
+        closeness = np.divide(reached * reached, pivots * distance,
+                              out=np.zeros(n), where=distance > 0)
+        return dict(zip(g.vertex_index(), closeness.tolist()))
 
     def visualize(g: Graph) -> None:
         """Visualizes g.
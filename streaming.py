@@ -0,0 +1,320 @@
+from array import array
+from itertools import islice
+import json
+import os
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from graphs import VertexIndex
+
+CHUNK_LINES = 1 << 16  # lines of the edge list read at a time
+
+
+def read_chunks(path: str, chunk_lines: int = CHUNK_LINES):
+    """Reads an edge list file, in the format accepted by `Graph`, in chunks.
+    At most chunk_lines lines of the file are held in memory at a time.
+    Args:
+    - path: the edge list file to read.
+    - chunk_lines: the number of lines read at a time.
+    Returns:
+    nothing.
+    Yields:
+    (src, dst, wts) lists for the edges of each chunk; wts is None if the
+    chunk has no weights.
+    """
+    with open(path) as f:
+        while True:
+            lines = list(islice(f, chunk_lines))
+            if not lines:
+                return
+            rows = [line.split() for line in lines]
+            rows = [row for row in rows if row]
+            src = [int(row[0]) for row in rows]
+            dst = [int(row[1]) for row in rows]
+            wts = None
+            if any(len(row) > 2 for row in rows):
+                wts = [float(row[2]) if len(row) > 2 else 1.0 for row in rows]
+            yield src, dst, wts
+
+
+class StreamStatistics:
+    """ Statistics of an edge list file computed in one streaming pass. """
+
+    def __init__(self, path: str, chunk_lines: int = CHUNK_LINES):
+        """Computes the statistics of the edge list in path.
+        Edges are read in chunks of chunk_lines and never kept, so memory is
+        bounded by the chunk size plus a few integers per vertex: the vertex
+        index, the degrees, and a union-find forest over the vertices for
+        the connected components.
+        Args:
+        - self: the instance to create.
+        - path: the edge list file, in the format accepted by `Graph`.
+        - chunk_lines: the number of lines read at a time.
+        Returns:
+        nothing.
+        """
+        self.index = VertexIndex()
+        self.degrees = array('l')  # degree of every dense index
+        self.parent = array('l')  # union-find parent of every dense index
+        self.size = array('l')  # size of the tree under every root
+        self.edgeCount = 0
+        self.weighted = False
+        for src, dst, wts in read_chunks(path, chunk_lines):
+            self.edgeCount += len(src)
+            self.weighted = self.weighted or wts is not None
+            for u, v in zip(src, dst):
+                u, v = self.intern(u), self.intern(v)
+                self.degrees[u] += 1
+                if u != v:  # self loops count once, as in `CSR`
+                    self.degrees[v] += 1
+                self.union(u, v)
+
+    def intern(self, v) -> int:
+        # dense index of v, growing the per-vertex arrays for new vertices
+        i = self.index.intern(v)
+        if i == len(self.degrees):
+            self.degrees.append(0)
+            self.parent.append(i)
+            self.size.append(1)
+        return i
+
+    def find(self, i: int) -> int:
+        # root of the tree of i, halving the path on the way
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, u: int, v: int) -> None:
+        # merges the trees of u and v, hanging the smaller under the larger
+        u, v = self.find(u), self.find(v)
+        if u == v:
+            return
+        if self.size[u] < self.size[v]:
+            u, v = v, u
+        self.parent[v] = u
+        self.size[u] += self.size[v]
+
+    def vertex_count(self) -> int:
+        """Returns the number of vertices in the edge list.
+        Args:
+        - self: this instance.
+        Returns:
+        the number of distinct vertices.
+        """
+        return len(self.index)
+
+    def edge_count(self) -> int:
+        """Returns the number of edges, i.e. non-empty lines, in the edge list.
+        Args:
+        - self: this instance.
+        Returns:
+        the number of edges.
+        """
+        return self.edgeCount
+
+    def has_weights(self) -> bool:
+        """Returns whether any edge in the edge list has a weight.
+        Args:
+        - self: this instance.
+        Returns:
+        True if the edges are weighted, False otherwise.
+        """
+        return self.weighted
+
+    def degree(self, v) -> int:
+        """Returns the degree of the vertex v.
+        Errors if v is not in the edge list. Check before calling.
+        Args:
+        - self: this instance.
+        - v: the vertex whose degree is sought.
+        Returns:
+        the degree of v.
+        """
+        return self.degrees[self.index.index(v)]
+
+    def degree_centrality(self, v) -> float:
+        """Returns the degree centrality of the vertex v.
+        Args:
+        - self: this instance.
+        - v: the vertex whose degree centrality is sought.
+        Returns:
+        the degree centrality of v.
+        """
+        return self.degree(v) / (self.vertex_count() - 1)
+
+    def degree_histogram(self) -> list:
+        """Returns the degree distribution.
+        Args:
+        - self: this instance.
+        Returns:
+        list whose d-th entry is the number of vertices of degree d.
+        """
+        degrees = np.frombuffer(self.degrees, dtype=self.degrees.typecode)
+        return np.bincount(degrees).tolist()
+
+    def component(self, v):
+        """Returns the representative of the connected component of v.
+        Two vertices are connected iff they have the same representative.
+        Args:
+        - self: this instance.
+        - v: the vertex whose component is sought.
+        Returns:
+        a vertex of the component of v.
+        """
+        return self.index.id(self.find(self.index.index(v)))
+
+    def component_sizes(self) -> list:
+        """Returns the sizes of the connected components.
+        Args:
+        - self: this instance.
+        Returns:
+        list of the number of vertices in every component, largest first.
+        """
+        return sorted((self.size[i] for i in range(len(self.parent))
+                       if self.parent[i] == i), reverse=True)
+
+
+def spill_csr(path: str, directory: str, partitions: int = 16,
+              chunk_lines: int = CHUNK_LINES):
+    """Writes the adjacency of an edge list file to disk as a partitioned CSR.
+    Reads the file twice: once for the statistics, which size the CSR, and
+    once to fill it. Vertices are split by dense index into partitions of
+    about equal size, each stored as .npy files written through memory maps,
+    so the edges are never all in memory.
+    Args:
+    - path: the edge list file, in the format accepted by `Graph`.
+    - directory: where to write the CSR; created if missing.
+    - partitions: the number of partitions.
+    - chunk_lines: the number of lines read at a time.
+    Returns:
+    the StreamStatistics of the file and a DiskCSR reading from directory.
+    """
+    stats = StreamStatistics(path, chunk_lines)
+    os.makedirs(directory, exist_ok=True)
+    n = stats.vertex_count()
+    degrees = np.frombuffer(stats.degrees, dtype=stats.degrees.typecode)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(degrees, out=indptr[1:])
+    bounds = np.linspace(0, n, partitions + 1).astype(np.int64)
+    np.save(os.path.join(directory, 'ids.npy'), np.array(stats.index.ids))
+    np.save(os.path.join(directory, 'bounds.npy'), bounds)
+    with open(os.path.join(directory, 'meta.json'), 'w') as f:
+        json.dump({'edges': stats.edge_count(), 'weighted': stats.weighted}, f)
+    parts = []
+    for p in range(partitions):
+        lo, hi = bounds[p], bounds[p + 1]
+        np.save(part_path(directory, p, 'indptr'), indptr[lo:hi + 1] - indptr[lo])
+        entries = int(indptr[hi] - indptr[lo])
+        parts.append((
+            open_memmap(part_path(directory, p, 'indices'), mode='w+',
+                        dtype=np.int64, shape=(entries,)),
+            open_memmap(part_path(directory, p, 'data'), mode='w+',
+                        dtype=np.float64, shape=(entries,))
+            if stats.weighted else None))
+    cursor = indptr[:-1].copy()  # next free entry of every row
+    positions = stats.index.positions
+    for src, dst, wts in read_chunks(path, chunk_lines):
+        u = np.array([positions[v] for v in src], dtype=np.int64)
+        v = np.array([positions[v] for v in dst], dtype=np.int64)
+        w = np.array(wts if wts is not None else [1.0] * len(src))
+        loop = u == v
+        rows = np.concatenate((u, v[~loop]))
+        cols = np.concatenate((v, u[~loop]))
+        vals = np.concatenate((w, w[~loop]))
+        order = np.argsort(rows, kind='stable')
+        rows, cols, vals = rows[order], cols[order], vals[order]
+        # entries of the same row go to consecutive free slots of that row
+        first = np.searchsorted(rows, rows, side='left')
+        slots = cursor[rows] + np.arange(len(rows)) - first
+        np.add.at(cursor, rows, 1)
+        part = np.searchsorted(bounds, rows, side='right') - 1
+        for p in np.unique(part):
+            mask = part == p
+            offset = slots[mask] - indptr[bounds[p]]
+            parts[p][0][offset] = cols[mask]
+            if parts[p][1] is not None:
+                parts[p][1][offset] = vals[mask]
+    for indices, data in parts:
+        indices.flush()
+        if data is not None:
+            data.flush()
+    return stats, DiskCSR(directory)
+
+
+def part_path(directory: str, p: int, name: str) -> str:
+    # file holding one array of partition p
+    return os.path.join(directory, f'part{p}.{name}.npy')
+
+
+class DiskCSR:
+    """ Read-only CSR written by spill_csr, queried through memory maps. """
+
+    def __init__(self, directory: str):
+        """Opens the partitioned CSR in directory.
+        Only the vertex ids and partition bounds are read into memory; the
+        neighbors are paged in from disk by the operating system on access.
+        Args:
+        - self: the instance to create.
+        - directory: a directory written by spill_csr.
+        Returns:
+        nothing.
+        """
+        self.index = VertexIndex()
+        for v in np.load(os.path.join(directory, 'ids.npy')).tolist():
+            self.index.intern(v)
+        self.bounds = np.load(os.path.join(directory, 'bounds.npy'))
+        with open(os.path.join(directory, 'meta.json')) as f:
+            meta = json.load(f)
+        self.edgeCount, self.weighted = meta['edges'], meta['weighted']
+        self.parts = [(
+            np.load(part_path(directory, p, 'indptr'), mmap_mode='r'),
+            np.load(part_path(directory, p, 'indices'), mmap_mode='r'),
+            np.load(part_path(directory, p, 'data'), mmap_mode='r')
+            if self.weighted else None) for p in range(len(self.bounds) - 1)]
+
+    def row(self, v):
+        # partition arrays and the slice of the row of v in them
+        i = self.index.index(v)
+        p = int(np.searchsorted(self.bounds, i, side='right')) - 1
+        indptr, indices, data = self.parts[p]
+        i -= self.bounds[p]
+        return indices, data, slice(indptr[i], indptr[i + 1])
+
+    def vertex_count(self) -> int:
+        # returns the number of vertices
+        return len(self.index)
+
+    def edge_count(self) -> int:
+        # returns the number of edges
+        return self.edgeCount
+
+    def has_vertex(self, v) -> bool:
+        # returns true if v has a row
+        return v in self.index
+
+    def has_weights(self) -> bool:
+        # returns true if the edges are weighted
+        return self.weighted
+
+    def degree(self, v) -> int:
+        # returns the length of the row of v
+        _, _, row = self.row(v)
+        return int(row.stop - row.start)
+
+    def neighbors(self, v):
+        # yields the neighbors of v read from its row
+        indices, _, row = self.row(v)
+        ids = self.index.ids
+        for j in indices[row].tolist():
+            yield ids[j]
+
+    def weight(self, v0, v1):
+        # returns the weight of the edge between v0 and v1; None if unweighted or absent
+        if not self.weighted:
+            return None
+        indices, data, row = self.row(v0)
+        hits = np.flatnonzero(indices[row] == self.index.index(v1))
+        return float(data[row][hits[0]]) if len(hits) else None
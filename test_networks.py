@@ -246,3 +246,221 @@ def test_popular_distance_list():
             assert int(case.result) == myresult,\
                 'AdjacencyList failed popular distance. '\
                 f'myresult: {myresult}, testcase: {case}'
+
+
+def local_graph(fname, imp):
+    return Graph(open('datasets/' + fname + '.txt').read(), imp=imp)
+
+
+def test_vertex_index_shared():
+    for imp in ('sets', 'matrix', 'list'):
+        g = local_graph('karate', imp)
+        index = g.vertex_index()
+        assert len(index) == g.vertex_count(), \
+            f'{imp} vertex index size differs from vertex count'
+        for i, v in enumerate(index):
+            assert index.index(v) == i and index.id(i) == v, \
+                f'{imp} vertex index does not round trip at {i}'
+            dense = sorted(index.id(j) for j, _ in g.dense_neighbors(i))
+            assert dense == sorted(g.neighbors(v)), \
+                f'{imp} dense neighbors of {v} differ from neighbors'
+
+
+def test_pagerank_warm_start():
+    g = local_graph('karate', 'list')
+    cold, warm = [], []
+    ranks = NetworkOperations.pagerank(
+        g, report=lambda it, residual: cold.append(residual))
+    assert round(sum(ranks.values()), 6) == 1, 'PageRank does not sum to 1'
+    assert max(ranks, key=ranks.get) == 33, 'PageRank top vertex is not 33'
+    NetworkOperations.pagerank(
+        g, start=ranks, report=lambda it, residual: warm.append(residual))
+    assert len(warm) < len(cold), 'warm start did not save iterations'
+
+
+def test_eigenvector_centrality():
+    for imp in ('sets', 'matrix', 'list'):
+        g = local_graph('karate', imp)
+        ranks = NetworkOperations.eigenvector_centrality(g)
+        assert round(100 * ranks[33]) == 37, \
+            f'{imp} failed eigenvector centrality. myresult: {ranks[33]}'
+
+
+def test_betweenness_centrality():
+    g = local_graph('karate', 'list')
+    exact = NetworkOperations.betweenness_centrality(g, processes=1)
+    assert round(100 * exact[0]) == 44, \
+        f'failed betweenness centrality. myresult: {exact[0]}'
+    pooled = NetworkOperations.betweenness_centrality(g, processes=2)
+    assert all(round(exact[v], 9) == round(pooled[v], 9) for v in exact), \
+        'pooled betweenness differs from single process'
+    sampled = [NetworkOperations.betweenness_centrality(
+        g, k=10, seed=7, processes=1) for _ in range(2)]
+    assert sampled[0] == sampled[1], 'sampled betweenness is not seeded'
+    for k in (0, -1):
+        try:
+            NetworkOperations.betweenness_centrality(g, k=k, processes=1)
+        except ValueError:
+            continue
+        assert False, f'betweenness accepted k={k}'
+
+
+def test_closeness_centrality():
+    g = local_graph('karate', 'sets')
+    closeness = NetworkOperations.closeness_centrality(g, processes=1)
+    assert round(100 * closeness[0]) == 57, \
+        f'failed closeness centrality. myresult: {closeness[0]}'
+    sampled = NetworkOperations.closeness_centrality(
+        g, k=g.vertex_count(), processes=1)
+    assert sampled == closeness, 'closeness from all pivots is not exact'
+
+
+def test_graph_views():
+    g = local_graph('karate', 'list')
+    ego = g.ego_network(0, 1)
+    assert ego.vertex_count() == g.degree(0) + 1, 'ego network misses vertices'
+    assert ego.degree(0) == g.degree(0), 'ego network misses edges of 0'
+    assert NetworkOperations.clustering_coefficient(ego, 0) == \
+        NetworkOperations.clustering_coefficient(g, 0), \
+        'ego network changes the clustering coefficient of 0'
+    core = g.k_core(4)
+    assert all(core.degree(v) >= 4 for v in core.vertices()), \
+        '4-core has a vertex of degree below 4'
+    assert g.k_core(5).vertex_count() == 0, 'karate has no 5-core'
+    copy = core.materialize('matrix')
+    assert (copy.vertex_count(), copy.edge_count()) == \
+        (core.vertex_count(), core.edge_count()), \
+        'materialized 4-core differs from the view'
+    sparse = g.subgraph([0, 1, 9]).materialize('list')
+    assert list(sparse.vertices()) == [0, 1, 9] and sparse.degree(9) == 0, \
+        'materialized subgraph lost a vertex without edges'
+    assert g.ego_network(5, 0).materialize('sets').vertex_count() == 1, \
+        'materialized ego network of radius 0 lost its center'
+
+
+def test_degree_index():
+    for imp in ('sets', 'matrix', 'list'):
+        g = local_graph('karate', imp)
+        index = g.degree_index()
+        assert index.max_vertex() == 33, f'{imp} failed max degree vertex'
+        assert NetworkOperations.top_degree(g, 3) == \
+            [(33, 17), (0, 16), (32, 12)], f'{imp} failed top degree'
+        histogram = NetworkOperations.degree_histogram(g)
+        assert sum(histogram) == g.vertex_count() and histogram[17] == 1, \
+            f'{imp} failed degree histogram'
+        cores = NetworkOperations.core_numbers(g)
+        assert max(cores.values()) == 4 and cores[11] == 1, \
+            f'{imp} failed core numbers'
+
+
+def test_streaming_statistics(tmp_path):
+    from streaming import StreamStatistics, spill_csr
+    g = local_graph('hep', 'list')
+    stats, disk = spill_csr('datasets/hep.txt', str(tmp_path), partitions=4,
+                            chunk_lines=1000)
+    assert (stats.vertex_count(), stats.edge_count(), stats.has_weights()) \
+        == (g.vertex_count(), g.edge_count(), g.has_weights()), \
+        'streaming statistics differ from Graph'
+    assert stats.degree_histogram() == NetworkOperations.degree_histogram(g), \
+        'streaming degree histogram differs from Graph'
+    assert sum(stats.component_sizes()) == g.vertex_count(), \
+        'streaming components do not cover the vertices'
+    for v in (87, 480, 24):
+        assert stats.degree_centrality(v) == \
+            NetworkOperations.degree_centrality(g, v), \
+            f'streaming degree centrality of {v} differs from Graph'
+        assert sorted(disk.neighbors(v)) == sorted(g.neighbors(v)), \
+            f'spilled neighbors of {v} differ from Graph'
+
+
+def test_compressed_adjacency():
+    for fname in ('karate', 'hep'):
+        plain, packed = local_graph(fname, 'list'), local_graph(fname, 'compressed')
+        assert packed.edge_count() == plain.edge_count(), \
+            f'compressed {fname} has the wrong number of edges'
+        for v in plain.vertices():
+            assert sorted(packed.neighbors(v)) == sorted(plain.neighbors(v)), \
+                f'compressed {fname} has the wrong neighbors of {v}'
+        for e in plain.edges():
+            assert packed.has_edge(e.v0, e.v1) and \
+                packed.weight(e.v0, e.v1) == plain.weight(e.v0, e.v1), \
+                f'compressed {fname} misses edge {e}'
+    assert not packed.has_edge(2, 4), 'compressed hep has a spurious edge'
+    assert NetworkOperations.popular_distance(packed, 2) == \
+        NetworkOperations.popular_distance(plain, 2), \
+        'compressed hep failed popular distance'
+
+
+def test_bulk_pair_queries():
+    for imp in ('sets', 'list', 'compressed'):
+        g = local_graph('hep', imp)
+        pairs = [(2, 3), (3, 2), (2, 4), (4, 6), (87, 480), (9, 10)]
+        assert list(g.has_edges(pairs)) == [g.has_edge(*p) for p in pairs], \
+            f'{imp} failed bulk has_edge'
+        weights = g.weights(pairs)
+        assert [None if math.isnan(w) else w for w in weights] == \
+            [g.weight(*p) for p in pairs], f'{imp} failed bulk weight'
+        similarities = NetworkOperations.similarities(g, pairs)
+        assert [round(s, 9) for s in similarities] == \
+            [round(NetworkOperations.similarity(g, *p), 9) for p in pairs], \
+            f'{imp} failed bulk similarity'
+        assert not g.has_edges([(2, -1)], validate=False)[0], \
+            f'{imp} found an edge to a missing vertex'
+        try:
+            g.has_edges((2, v) for v in (3, -1))
+        except AssertionError:
+            continue
+        assert False, f'{imp} accepted a missing vertex from a generator'
+
+
+def test_lazy_construction():
+    for imp in ('sets', 'matrix', 'list'):
+        g = Graph(open('datasets/karate.txt').read(), imp, lazy=True)
+        assert (g.vertex_count(), g.edge_count()) == (34, 78) and \
+            g.materialized() == [], f'lazy {imp} built a structure to count'
+        assert g.degree(33) == 17 and g.materialized() == ['degrees'], \
+            f'lazy {imp} built more than degrees for degree'
+        assert round(100 * NetworkOperations.clustering_coefficient(g, 0)) \
+            == 15 and imp in g.materialized(), \
+            f'lazy {imp} failed clustering coefficient'
+        g.drop(imp, 'degrees')
+        assert imp not in g.materialized(), f'lazy {imp} did not drop'
+        assert sorted(g.neighbors(11)) == [0], f'lazy {imp} did not rebuild'
+
+
+def test_distance_matrix():
+    g = local_graph('karate', 'list')
+    matrix = NetworkOperations.distance_matrix(g)
+    assert matrix.shape == (34, 34) and (matrix == matrix.T).all(), \
+        'distance matrix is not square and symmetric'
+    vertices = list(g.vertices())
+    for v in (0, 16, 33):
+        row = matrix[vertices.index(v)]
+        assert row[vertices.index(33)] == \
+            round(dijkstra(g, v, vertices, 33)), \
+            f'distance matrix differs from dijkstra at {v}'
+    assert NetworkOperations.diameter(g) == 5, 'failed diameter'
+    assert NetworkOperations.eccentricity(g, 16) == 5, 'failed eccentricity'
+    assert round(NetworkOperations.average_shortest_path_length(g), 2) \
+        == 2.41, 'failed average shortest path length'
+    weighted = local_graph('hep', 'list')
+    assert NetworkOperations.distance_matrix(weighted, [2], [405])[0, 0] \
+        == 0.2, 'weighted distance matrix failed'
+
+
+def test_lazy_matches_eager():
+    edges = '1 1 2\n1 2 1\n2 3 5\n2 3 5\n3 4 1\n4 3 2'
+    for imp in ('sets', 'matrix', 'list', 'compressed'):
+        eager, lazy = Graph(edges, imp), Graph(edges, imp, lazy=True)
+        for v in eager.vertices():
+            assert lazy.degree(v) == eager.degree(v), \
+                f'lazy {imp} degree of {v} differs from eager'
+        assert sorted(map(repr, lazy.edges())) == \
+            sorted(map(repr, eager.edges())), f'lazy {imp} edges differ'
+        assert lazy.csr().degrees().tolist() == \
+            eager.csr().degrees().tolist(), f'lazy {imp} CSR differs'
+        assert NetworkOperations.top_degree(lazy, 4) == \
+            NetworkOperations.top_degree(eager, 4), \
+            f'lazy {imp} degree index differs'
+        assert imp not in lazy.materialized(), \
+            f'lazy {imp} built its implementation for degree queries'